@@ -6,52 +6,203 @@ This application allows users to:
 3. Display lyrics for the selected song
 """
 
-from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QBoxLayout, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QLabel, QScrollArea
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QBoxLayout, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QListWidgetItem, QLabel, QPlainTextEdit
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QPixmap
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
+import lyricsgenius
 import requests
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional
+from collections import OrderedDict
 import sys
 import os
+import re
+import threading
 from dotenv import load_dotenv
-from io import BytesIO
 
 # Load environment variables from .env file
 load_dotenv()
 
-class LyricsWorker(QThread):
-    lyrics_ready = pyqtSignal(str)
-    error_occurred = pyqtSignal(str)
+RECENT_TRACKS_LIMIT = 10  # Number of recently played tracks shown in the list
+IMAGE_SIZE = 200  # Width and height of the cover image label in pixels
+LYRICS_CACHE_SIZE = 64  # Maximum number of lyrics kept in memory
+PIXMAP_CACHE_SIZE = 32  # Maximum number of cover images kept in memory
+SELECTION_DEBOUNCE_MS = 250  # Delay before fetching lyrics for a selected track
+WORKER_THREADS = 4  # Threads for the lyrics and cover downloads of the selected track
+PREFETCH_THREADS = 4  # Threads for pre-fetching cover images
+HTTP_TIMEOUT = (3, 5)  # Connect and read timeouts in seconds for image downloads
+SPOTIFY_TIMEOUT = 5  # Timeout in seconds for Spotify API calls
+GENIUS_TIMEOUT = 10  # Timeout in seconds for Genius API calls
+
+# Same retry policy spotipy mounts on the sessions it builds itself: back off on
+# rate limits (429) and server errors, since passing our own session skips it
+HTTP_RETRY = Retry(
+    total=spotipy.Spotify.max_retries,
+    connect=None,
+    read=False,
+    allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+    status=spotipy.Spotify.max_retries,
+    backoff_factor=0.3,
+    status_forcelist=spotipy.Spotify.default_retry_codes,
+)
+
+# Genius client shared by all lyrics workers so its session keeps connections alive
+_GENIUS = None
+_GENIUS_LOCK = threading.Lock()
+
+def get_genius() -> lyricsgenius.Genius:
+    """
+    Return the shared Genius client, creating it on first use
+    """
+    global _GENIUS
+    with _GENIUS_LOCK:
+        if _GENIUS is None:
+            _GENIUS = lyricsgenius.Genius(
+                os.getenv('GENIUS_ACCESS_TOKEN'),
+                timeout=GENIUS_TIMEOUT,
+                retries=1,
+                remove_section_headers=True,
+            )
+            # Releases before 3.15 print search progress unless verbose is off;
+            # 3.15 dropped the attribute and logs through the 'lyricsgenius' logger instead
+            if hasattr(_GENIUS, 'verbose'):
+                _GENIUS.verbose = False
+        return _GENIUS
+
+# Genius extras around the lyrics, compiled once at import
+_RE_HEADER = re.compile(r'^.*?Lyrics\n', re.DOTALL)  # Leading "N ContributorsTitle Lyrics" line
+_RE_EMBED = re.compile(r'\d*Embed\s*$')  # Trailing "123Embed" footer
+
+def clean_lyrics(lyrics: str) -> str:
+    """
+    Remove the Genius extras around the lyrics:
+    1. Drop the header up to the first "Lyrics" line ("N ContributorsTitle Lyrics")
+    2. Strip the trailing "Embed" footer and surrounding whitespace
+    """
+    text = _RE_HEADER.sub('', lyrics, count=1)
+    return _RE_EMBED.sub('', text).strip()
+
+class ConditionalGetAdapter(HTTPAdapter):
+    """
+    HTTP adapter that revalidates repeated GETs with the last ETag:
+    1. Remember the ETag of the last successful response and its URL
+    2. Send it as If-None-Match when the same URL is requested again
+    3. An unchanged resource then comes back as an empty 304 response
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._etag_url = None
+        self._etag = None
+
+    def send(self, request, **kwargs):
+        if request.method == 'GET' and request.url == self._etag_url:
+            request.headers['If-None-Match'] = self._etag
+        response = super().send(request, **kwargs)
+        if response.status_code == 200 and 'ETag' in response.headers:
+            self._etag_url = request.url
+            self._etag = response.headers['ETag']
+        return response
+
+class LyricsWorker(QRunnable):
+    class Signals(QObject):
+        lyrics_ready = pyqtSignal(str)
+        error_occurred = pyqtSignal(str)
+        timed_out = pyqtSignal()
 
     def __init__(self, track_name: str, artist_name: str):
         super().__init__()
+        self.signals = LyricsWorker.Signals()
         self.track_name = track_name
         self.artist_name = artist_name
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Ask the worker to stop: the fetched lyrics are discarded
+        The shared Genius session is left open so its connections can be reused
+        """
+        self._cancelled = True
 
     def run(self):
+        if self._cancelled:
+            return
         try:
-            import lyricsgenius
-            genius = lyricsgenius.Genius(os.getenv('GENIUS_ACCESS_TOKEN'))
-            song = genius.search_song(self.track_name, self.artist_name)
-            
+            song = get_genius().search_song(self.track_name, self.artist_name)
+
+            if self._cancelled:
+                return
             if song:
-                self.lyrics_ready.emit(song.lyrics)
+                self.signals.lyrics_ready.emit(clean_lyrics(song.lyrics))
             else:
-                self.lyrics_ready.emit("Lyrics not found")
+                self.signals.lyrics_ready.emit("Lyrics not found")
+        except requests.exceptions.Timeout:
+            if not self._cancelled:
+                self.signals.timed_out.emit()
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            if not self._cancelled:
+                self.signals.error_occurred.emit(str(e))
+
+class ImageWorker(QRunnable):
+    class Signals(QObject):
+        image_ready = pyqtSignal(str, bytes)
+        error_occurred = pyqtSignal(str)
+        timed_out = pyqtSignal()
+        done = pyqtSignal(str)  # Emitted with the URL once run() returns, even when cancelled
+
+    def __init__(self, session: requests.Session, url: str):
+        super().__init__()
+        self.signals = ImageWorker.Signals()
+        self.session = session
+        self.url = url
+        self.started = False
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Ask the worker to stop: the downloaded image is discarded
+        """
+        self._cancelled = True
+
+    def run(self):
+        self.started = True
+        try:
+            if self._cancelled:
+                return
+            response = self.session.get(self.url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            if not self._cancelled:
+                self.signals.image_ready.emit(self.url, response.content)
+        except requests.exceptions.Timeout:
+            if not self._cancelled:
+                self.signals.timed_out.emit()
+        except Exception as e:
+            if not self._cancelled:
+                self.signals.error_occurred.emit(str(e))
+        finally:
+            self.signals.done.emit(self.url)
 
 class MiniPlayer(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Shared HTTP session so Spotify API calls and cover-art downloads reuse connections
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=HTTP_RETRY))
+        # Recently played requests are revalidated so unchanged refreshes skip the body
+        self.http.mount(
+            'https://api.spotify.com/v1/me/player/recently-played',
+            ConditionalGetAdapter(pool_connections=4, pool_maxsize=10, max_retries=HTTP_RETRY)
+        )
+
         self.sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
             client_id=os.getenv('SPOTIFY_CLIENT_ID'),
             client_secret=os.getenv('SPOTIFY_CLIENT_SECRET'),
             redirect_uri='http://localhost:8888/callback',
             scope='user-read-recently-played',
-        ))
+        ), requests_session=self.http, requests_timeout=SPOTIFY_TIMEOUT)
         
         # Set up the main window
         self.setWindowTitle("Lyrics Mini Player")
@@ -63,9 +214,28 @@ class MiniPlayer(QMainWindow):
         self.layout.setSpacing(5)  # Reduced spacing between widgets
         self.layout.setContentsMargins(5, 5, 5, 5)  # Reduced margins
 
+        # Workers for the selected track get their own pool so they never queue behind
+        # pre-fetch downloads or behind cancelled lyrics searches that are still running
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(WORKER_THREADS)
+        self.prefetch_pool = QThreadPool(self)
+        self.prefetch_pool.setMaxThreadCount(PREFETCH_THREADS)
+
         # Store track data
         self.track_data = {}  # Dictionary to store track information
+        self._last_played_at = None  # Spotify cursor (ms since epoch) of the most recent play
         self.lyrics_worker = None  # Store the current lyrics worker
+        self.image_worker = None  # Store the current image worker
+        self.prefetch_workers: Dict[str, ImageWorker] = {}  # In-flight cover art pre-fetches by URL
+        self.lyrics_cache: OrderedDict[tuple[str, str], str] = OrderedDict()  # Lyrics by (track, artist)
+        self.pixmap_cache: OrderedDict[str, QPixmap] = OrderedDict()  # Scaled cover images by URL
+
+        # Lyrics are only fetched for the last track selected within the debounce interval
+        self._pending_selection = None
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(SELECTION_DEBOUNCE_MS)
+        self._select_timer.timeout.connect(self.fire_selection)
 
         # Create UI elements
         self.setup_ui()
@@ -77,7 +247,7 @@ class MiniPlayer(QMainWindow):
         """
         Set up the user interface elements:
         1. Create a list widget for recently played tracks
-        2. Create a scrollable label for displaying lyrics
+        2. Create a read-only text view for displaying lyrics
         3. Create buttons for login and refresh
         4. Add all elements to the layout
         """
@@ -90,7 +260,7 @@ class MiniPlayer(QMainWindow):
         # Create image label
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setFixedSize(200, 200)  # Made image smaller
+        self.image_label.setFixedSize(IMAGE_SIZE, IMAGE_SIZE)  # Made image smaller
         self.image_label.setStyleSheet("""
             QLabel {
                 background-color: #f0f0f0;
@@ -105,23 +275,12 @@ class MiniPlayer(QMainWindow):
         self.track_list.itemClicked.connect(self.on_track_selected)
         self.layout.addWidget(self.track_list)
 
-        # Create a scroll area for lyrics
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.hide()  # Hide the scroll area initially
-        
-        # Create a container widget for the lyrics label
-        self.lyrics_container = QWidget()
-        self.lyrics_layout = QVBoxLayout(self.lyrics_container)
-        
-        self.lyrics_label = QLabel()
-        self.lyrics_label.setWordWrap(True)
-        self.lyrics_layout.addWidget(self.lyrics_label)
-        
-        # Set the container widget as the scroll area's widget
-        self.scroll_area.setWidget(self.lyrics_container)
-        self.layout.addWidget(self.scroll_area)
+        # Create a read-only text view for lyrics; it scrolls and only lays out visible lines
+        self.lyrics_view = QPlainTextEdit()
+        self.lyrics_view.setReadOnly(True)
+        self.lyrics_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        self.lyrics_view.hide()  # Hide the lyrics view initially
+        self.layout.addWidget(self.lyrics_view)
 
         #self.login_button = QPushButton("Login with Spotify")
         #self.login_button.clicked.connect(self.login_with_spotify)
@@ -141,23 +300,21 @@ class MiniPlayer(QMainWindow):
         3. Add tracks to the list widget
         """
         try:
-            results = self.sp.current_user_recently_played(limit=10)
+            results = self.sp.current_user_recently_played(limit=RECENT_TRACKS_LIMIT)
+            if results is None:  # 304 Not Modified: keep the current list
+                return
             tracks = results['items']
+            self.track_list.clear()
             self.track_data.clear()  # Clear previous track data
             
-            for track in tracks:
-                track_name = track['track']['name']
-                artist_name = track['track']['artists'][0]['name']
-                image_url = track['track']['album']['images'][0]['url']  # Get image URL directly
-                
-                # Store track data
-                self.track_data[f"{track_name} - {artist_name}"] = {
-                    'name': track_name,
-                    'artist': artist_name,
-                    'image_url': image_url
-                }
-                
-                self.track_list.addItem(f"{track_name} - {artist_name}")
+            # Add all items before repainting the list
+            self.track_list.setUpdatesEnabled(False)
+            try:
+                for track in tracks:
+                    self.track_list.addItem(self.store_track(track))
+            finally:
+                self.track_list.setUpdatesEnabled(True)
+            self.update_last_played(results)
             
             # Load image for the first track
             if tracks:
@@ -165,104 +322,369 @@ class MiniPlayer(QMainWindow):
                 track_name = first_track['track']['name']
                 artist_name = first_track['track']['artists'][0]['name']
                 self.display_image(track_name, artist_name)
+
+            # Download the remaining cover images in background
+            self.prefetch_images([data['image_url'] for data in self.track_data.values()])
         except Exception as e:
             print(f"Error loading recent tracks: {e}")
 
+    def store_track(self, track: Dict) -> QListWidgetItem:
+        """
+        Extract track information from a recently played item and store it in track_data
+        Returns the list widget item for the track, carrying its (track, artist) key
+        """
+        track_name = track['track']['name']
+        artist_name = track['track']['artists'][0]['name']
+        # Spotify lists album images largest first; use the smallest one that still fills the label
+        images = track['track']['album']['images']
+        image_url = next(
+            (image['url'] for image in reversed(images) if (image.get('width') or 0) >= IMAGE_SIZE),
+            images[0]['url']
+        )
+
+        # Store track data
+        track_key = (track_name, artist_name)
+        self.track_data[track_key] = {
+            'name': track_name,
+            'artist': artist_name,
+            'image_url': image_url
+        }
+
+        item = QListWidgetItem(f"{track_name} - {artist_name}")
+        item.setData(Qt.ItemDataRole.UserRole, track_key)
+        return item
+
+    def update_last_played(self, results: Dict):
+        """
+        Remember Spotify's cursor for the most recent play so refreshes only ask for newer plays
+        """
+        cursors = results.get('cursors') or {}
+        if cursors.get('after'):
+            self._last_played_at = int(cursors['after'])
+
     def display_image(self, track_name: str, artist_name: str):
         """
         Display the image for the selected track using stored image URL
         """
-        try:
-            track_key = f"{track_name} - {artist_name}"
-            if track_key in self.track_data:
-                image_url = self.track_data[track_key]['image_url']
-                # Download the image
-                response = requests.get(image_url)
-                image_data = BytesIO(response.content)
-                
-                # Create QPixmap and scale it to fit the label
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data.getvalue())
-                
-                # Scale the pixmap to fit the label while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    200,  # Reduced width
-                    200,  # Reduced height
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                self.image_label.setPixmap(scaled_pixmap)
-            else:
-                self.image_label.setText("No image available")
-        except Exception as e:
-            print(f"Error displaying image: {e}")
-            self.image_label.setText("Error loading image")
+        track_key = (track_name, artist_name)
+        if track_key not in self.track_data:
+            self.image_label.setText("No image available")
+            return
+
+        image_url = self.track_data[track_key]['image_url']
+
+        # Cancel any existing image worker, unless it is a pre-fetch that should still fill the cache
+        if self.image_worker:
+            if self.prefetch_workers.get(self.image_worker.url) is not self.image_worker:
+                self.image_worker.cancel()
+            self.image_worker = None
+
+        # Use the cached image if it was downloaded before
+        if image_url in self.pixmap_cache:
+            self.pixmap_cache.move_to_end(image_url)
+            self.image_label.setPixmap(self.pixmap_cache[image_url])
+            return
+
+        # Wait for a running pre-fetch of this image instead of downloading it twice;
+        # a pre-fetch still queued behind others is replaced by a download for display
+        prefetch = self.prefetch_workers.get(image_url)
+        if prefetch and prefetch.started:
+            self.image_worker = prefetch
+            self.image_worker.signals.image_ready.connect(self.update_image)
+            self.image_worker.signals.error_occurred.connect(self.handle_image_error)
+            self.image_worker.signals.timed_out.connect(self.handle_image_timeout)
+            return
+        if prefetch:
+            prefetch.cancel()
+            del self.prefetch_workers[image_url]
+
+        # Download the image in background
+        self.image_worker = ImageWorker(self.http, image_url)
+        self.image_worker.signals.image_ready.connect(self.update_image)
+        self.image_worker.signals.error_occurred.connect(self.handle_image_error)
+        self.image_worker.signals.timed_out.connect(self.handle_image_timeout)
+        self.pool.start(self.image_worker)
+
+    def update_image(self, image_url: str, data: bytes):
+        """
+        Update the image label with the downloaded image data
+        Images from a replaced worker are cached but not shown
+        """
+        # A pre-fetch worker adopted for display has already cached the image
+        scaled_pixmap = self.pixmap_cache.get(image_url)
+        if scaled_pixmap is None:
+            scaled_pixmap = self.cache_image(image_url, data)
+        if not self.is_current_worker(self.image_worker):
+            return
+        if scaled_pixmap is None:
+            self.handle_image_error(f"Could not decode image from {image_url}")
+            return
+        self.image_label.setPixmap(scaled_pixmap)
+
+    def cache_image(self, image_url: str, data: bytes) -> Optional[QPixmap]:
+        """
+        Decode downloaded image data, scale it and store it in the pixmap cache
+        Returns None without caching when the data is not a valid image
+        """
+        # Create QPixmap from the raw bytes and scale it to fit the label
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data) or pixmap.isNull():
+            return None
+
+        # Scale the pixmap to fit the label while maintaining aspect ratio
+        # This runs once per URL since the result is cached
+        scaled_pixmap = pixmap.scaled(
+            IMAGE_SIZE,
+            IMAGE_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
+        self.pixmap_cache[image_url] = scaled_pixmap
+        if len(self.pixmap_cache) > PIXMAP_CACHE_SIZE:
+            self.pixmap_cache.popitem(last=False)
+
+        return scaled_pixmap
+
+    def prefetch_images(self, image_urls: List[str]):
+        """
+        Download cover images in background so selecting a track shows them immediately:
+        1. Cancel pre-fetches of images that are no longer listed
+        2. Skip images that are already cached or being downloaded
+        3. Start one image worker per remaining URL
+        4. Store each downloaded image in the pixmap cache
+        """
+        image_urls = list(dict.fromkeys(image_urls))
+        for image_url, worker in list(self.prefetch_workers.items()):
+            if image_url not in image_urls and worker is not self.image_worker:
+                worker.cancel()
+                del self.prefetch_workers[image_url]
+
+        for image_url in image_urls:
+            if image_url in self.pixmap_cache or image_url in self.prefetch_workers:
+                continue
+            if self.image_worker and self.image_worker.url == image_url:
+                continue
+            worker = ImageWorker(self.http, image_url)
+            worker.signals.image_ready.connect(self.cache_image)
+            worker.signals.error_occurred.connect(self.handle_prefetch_error)
+            worker.signals.timed_out.connect(self.handle_prefetch_timeout)
+            worker.signals.done.connect(self.prefetch_finished)
+            self.prefetch_workers[image_url] = worker
+            self.prefetch_pool.start(worker)
+
+    def prefetch_finished(self, image_url: str):
+        """
+        Forget a pre-fetch worker once it has returned
+        """
+        if self.is_current_worker(self.prefetch_workers.get(image_url)):
+            del self.prefetch_workers[image_url]
+
+    def handle_prefetch_error(self, error: str):
+        """
+        Handle errors from the image pre-fetch workers
+        """
+        print(f"Error pre-fetching image: {error}")
+
+    def handle_prefetch_timeout(self):
+        """
+        Handle a timed out download in an image pre-fetch worker
+        """
+        print("Error pre-fetching image: request timed out")
+
+    def handle_image_error(self, error: str):
+        """
+        Handle errors from the image worker
+        """
+        if not self.is_current_worker(self.image_worker):
+            return
+        print(f"Error displaying image: {error}")
+        self.image_label.setText("Error loading image")
+
+    def handle_image_timeout(self):
+        """
+        Handle a timed out download in the image worker
+        """
+        if not self.is_current_worker(self.image_worker):
+            return
+        print("Error displaying image: request timed out")
+        self.image_label.setText("Image download timed out")
 
     def display_lyrics(self, track_name: str, artist_name: str):
         """
         Display lyrics for the selected track:
         1. Use a lyrics API (e.g., Genius, Musixmatch) to fetch lyrics
-        2. Update the lyrics label with the fetched text
+        2. Update the lyrics view with the fetched text
         3. Handle cases where lyrics are not available
         """
+        # Use cached lyrics if this track was fetched before
+        key = (track_name, artist_name)
+        if key in self.lyrics_cache:
+            self.lyrics_cache.move_to_end(key)
+            if self.lyrics_worker:
+                self.lyrics_worker.cancel()
+                self.lyrics_worker = None
+            self.lyrics_view.show()
+            self.show_lyrics(self.lyrics_cache[key])
+            return
+
         # Show loading message
-        self.lyrics_label.setText("Loading lyrics...")
-        self.scroll_area.show()
+        self.lyrics_view.setPlainText("Loading lyrics...")
+        self.lyrics_view.show()
 
         # Cancel any existing lyrics worker
-        if self.lyrics_worker and self.lyrics_worker.isRunning():
-            self.lyrics_worker.terminate()
-            self.lyrics_worker.wait()
+        if self.lyrics_worker:
+            self.lyrics_worker.cancel()
 
         # Create and start new lyrics worker
         self.lyrics_worker = LyricsWorker(track_name, artist_name)
-        self.lyrics_worker.lyrics_ready.connect(self.update_lyrics)
-        self.lyrics_worker.error_occurred.connect(self.handle_lyrics_error)
-        self.lyrics_worker.start()
+        self.lyrics_worker.signals.lyrics_ready.connect(self.update_lyrics)
+        self.lyrics_worker.signals.error_occurred.connect(self.handle_lyrics_error)
+        self.lyrics_worker.signals.timed_out.connect(self.handle_lyrics_timeout)
+        self.pool.start(self.lyrics_worker)
+
+    def is_current_worker(self, worker: Optional[QRunnable]) -> bool:
+        """
+        Check that the signal being handled was emitted by the given worker
+        Results already queued by a retired worker arrive after it was replaced
+        """
+        return worker is not None and self.sender() is worker.signals
 
     def update_lyrics(self, lyrics: str):
         """
-        Update the lyrics label with the fetched lyrics
+        Cache and show the lyrics fetched by the current lyrics worker
+        """
+        worker = self.lyrics_worker
+        if not self.is_current_worker(worker):
+            return
+
+        # Cache lyrics under the worker's track
+        self.lyrics_cache[(worker.track_name, worker.artist_name)] = lyrics
+        if len(self.lyrics_cache) > LYRICS_CACHE_SIZE:
+            self.lyrics_cache.popitem(last=False)
+
+        self.show_lyrics(lyrics)
+
+    def show_lyrics(self, lyrics: str):
+        """
+        Update the lyrics view with the fetched lyrics
         """
         if lyrics == "Lyrics not found":
-            self.lyrics_label.setText("No lyrics available for this track.")
+            self.lyrics_view.setPlainText("No lyrics available for this track.")
         else:
-            self.lyrics_label.setText(lyrics)
+            self.lyrics_view.setPlainText(lyrics)
 
     def handle_lyrics_error(self, error: str):
         """
         Handle errors from the lyrics worker
         """
+        if not self.is_current_worker(self.lyrics_worker):
+            return
         print(f"Error fetching lyrics: {error}")
-        self.lyrics_label.setText("Error fetching lyrics. Please try again later.")
+        self.lyrics_view.setPlainText("Error fetching lyrics. Please try again later.")
+
+    def handle_lyrics_timeout(self):
+        """
+        Handle a timed out request in the lyrics worker
+        """
+        if not self.is_current_worker(self.lyrics_worker):
+            return
+        print("Error fetching lyrics: request timed out")
+        self.lyrics_view.setPlainText("Fetching lyrics timed out. Please try again later.")
 
     def on_track_selected(self):
         """
         Handle track selection:
         1. Get the selected track from the list widget
         2. Extract track and artist information
-        3. Call display_lyrics with the track information
+        3. Call display_lyrics with the track information, debounced unless the lyrics are cached
         """
         selected_item = self.track_list.currentItem()
         if selected_item:
-            track_name, artist_name = selected_item.text().split(" - ")
+            track_name, artist_name = selected_item.data(Qt.ItemDataRole.UserRole)
             # Update image immediately
             self.display_image(track_name, artist_name)
-            # Start loading lyrics in background
-            self.display_lyrics(track_name, artist_name)
+            # Start loading lyrics once the selection settles
+            self._pending_selection = (track_name, artist_name)
+            if self._pending_selection in self.lyrics_cache:
+                self._select_timer.stop()
+                self.fire_selection()
+            else:
+                self._select_timer.start()
             print(f"Track selected: {track_name} - {artist_name}")
         else:
-            self.scroll_area.hide()  # Hide the scroll area if no track is selected
+            self._select_timer.stop()
+            self._pending_selection = None
+            self.lyrics_view.hide()  # Hide the lyrics view if no track is selected
+
+    def fire_selection(self):
+        """
+        Display lyrics for the last selected track
+        """
+        if self._pending_selection:
+            track_name, artist_name = self._pending_selection
+            self._pending_selection = None
+            self.display_lyrics(track_name, artist_name)
 
     def refresh_tracks(self):
         """
         Refresh the list of recently played tracks:
-        1. Clear the current list
-        2. Call load_recent_tracks to update the list
+        1. Without a previous load, call load_recent_tracks to reload the list
+        2. Otherwise ask Spotify only for tracks played since the last refresh
+        3. Add new tracks to the top of the list and drop the oldest ones
+        4. Reload the whole list when a full page of new tracks comes back
         """
-        self.track_list.clear()
-        self.load_recent_tracks()
+        if self._last_played_at is None:
+            self.load_recent_tracks()
+            return
+
+        try:
+            results = self.sp.current_user_recently_played(limit=RECENT_TRACKS_LIMIT, after=self._last_played_at)
+            if results is None:  # 304 Not Modified: nothing new was played
+                return
+            tracks = results['items']
+            if not tracks:
+                return
+            if len(tracks) >= RECENT_TRACKS_LIMIT:
+                # A full page may not reach back to the last refresh, so reload the latest tracks
+                self.load_recent_tracks()
+                return
+
+            # Insert new tracks and drop the oldest ones before repainting the list
+            self.track_list.setUpdatesEnabled(False)
+            try:
+                for row, track in enumerate(tracks):
+                    self.track_list.insertItem(row, self.store_track(track))
+
+                # Keep only the most recent tracks
+                while self.track_list.count() > RECENT_TRACKS_LIMIT:
+                    self.track_list.takeItem(self.track_list.count() - 1)
+            finally:
+                self.track_list.setUpdatesEnabled(True)
+            self.update_last_played(results)
+
+            shown = {
+                self.track_list.item(row).data(Qt.ItemDataRole.UserRole)
+                for row in range(self.track_list.count())
+            }
+            for track_key in list(self.track_data):
+                if track_key not in shown:
+                    del self.track_data[track_key]
+
+            # Download the new cover images in background
+            self.prefetch_images([data['image_url'] for data in self.track_data.values()])
+        except Exception as e:
+            print(f"Error refreshing recent tracks: {e}")
+
+    def closeEvent(self, event):
+        """
+        Cancel pending workers and release the shared HTTP session when the window is closed
+        """
+        for worker in [self.lyrics_worker, self.image_worker, *self.prefetch_workers.values()]:
+            if worker:
+                worker.cancel()
+        self.http.close()
+        super().closeEvent(event)
 
     def login_with_spotify(self):
         """
@@ -279,4 +701,3 @@ if __name__ == '__main__':
     player = MiniPlayer()
     player.show()
     sys.exit(app.exec())
-    pass
@@ -0,0 +1,382 @@
+import os
+import threading
+import time
+
+import json
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt6.QtGui import QColor, QPixmap
+
+import main_window
+from spotipy import Spotify
+
+
+def make_track(name: str, artist: str, played_at: int) -> dict:
+    """
+    Build a recently played item; played_at is in ms since epoch like Spotify's cursors
+    """
+    return {
+        'played_at': played_at,
+        'track': {
+            'name': name,
+            'artists': [{'name': artist}],
+            'album': {'images': [
+                {'url': f'https://i.scdn.co/{name}-640', 'width': 640},
+                {'url': f'https://i.scdn.co/{name}-300', 'width': 300},
+                {'url': f'https://i.scdn.co/{name}-64', 'width': 64},
+            ]},
+        },
+    }
+
+
+def png_bytes() -> bytes:
+    pixmap = QPixmap(300, 300)
+    pixmap.fill(QColor('red'))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    pixmap.save(buffer, 'PNG')
+    return bytes(data)
+
+
+class FakeSpotify:
+    """
+    Recently played endpoint over a play history listed newest first
+    """
+    history = [
+        make_track('One', 'Artist A', 2000),
+        make_track('Two', 'Artist B', 1000),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def current_user_recently_played(self, limit=10, after=None):
+        self.calls.append(after)
+        if after is None:
+            items = self.history[:limit]
+        else:
+            # Spotify pages forward from the cursor: the oldest plays after it come first
+            items = [item for item in self.history if item['played_at'] > after][-limit:]
+        cursors = {'after': str(items[0]['played_at']), 'before': str(items[-1]['played_at'])} if items else None
+        return {'items': items, 'cursors': cursors}
+
+
+class FakeSong:
+    def __init__(self, title: str):
+        self.lyrics = f'1 Contributor{title} Lyrics\nla la {title}\n3Embed'
+
+
+class FakeGenius:
+    def search_song(self, track_name, artist_name):
+        return FakeSong(track_name)
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def fakes(app, monkeypatch):
+    """
+    Replace Spotify, Genius and image downloads with in-process fakes
+    """
+    content = png_bytes()
+    monkeypatch.setattr(main_window.spotipy, 'Spotify', FakeSpotify)
+    monkeypatch.setattr(main_window, 'SpotifyOAuth', lambda **kwargs: None)
+    monkeypatch.setattr(main_window, 'get_genius', FakeGenius)
+    monkeypatch.setattr(main_window.requests.Session, 'get', lambda self, url, **kwargs: FakeResponse(content))
+    return content
+
+
+def close(player):
+    player.close()
+    player.pool.waitForDone()
+    player.prefetch_pool.waitForDone()
+    QtWidgets.QApplication.processEvents()
+
+
+@pytest.fixture
+def player(fakes):
+    player = main_window.MiniPlayer()
+    yield player
+    close(player)
+
+
+def settle(player, seconds: float = 0.5):
+    """
+    Let the debounce timer fire and queued worker results reach the window
+    """
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        player.pool.waitForDone(25)
+        player.prefetch_pool.waitForDone(25)
+        QtWidgets.QApplication.processEvents()
+
+
+def select(player, row: int):
+    player.track_list.setCurrentRow(row)
+    player.on_track_selected()
+    settle(player)
+
+
+def test_selecting_second_track_shows_its_lyrics_and_image(player):
+    settle(player)
+    select(player, 0)
+    assert player.lyrics_view.toPlainText() == 'la la One'
+
+    select(player, 1)
+    assert player.lyrics_view.toPlainText() == 'la la Two'
+    assert not player.image_label.pixmap().isNull()
+    assert ('Two', 'Artist B') in player.lyrics_cache
+
+
+def test_get_genius_creates_one_shared_client(monkeypatch):
+    monkeypatch.setenv('GENIUS_ACCESS_TOKEN', 'token')
+    monkeypatch.setattr(main_window, '_GENIUS', None)
+    genius = main_window.get_genius()
+    assert genius is main_window.get_genius()
+    assert genius.timeout == main_window.GENIUS_TIMEOUT
+    assert genius.retries == 1
+    assert genius.remove_section_headers is True
+
+
+def test_invalid_image_data_is_not_cached(player):
+    settle(player)
+    player.image_worker = main_window.ImageWorker(player.http, 'https://i.scdn.co/broken')
+    player.image_worker.signals.image_ready.connect(player.update_image)
+    player.image_worker.signals.image_ready.emit('https://i.scdn.co/broken', b'<html>Not Found</html>')
+    assert 'https://i.scdn.co/broken' not in player.pixmap_cache
+    assert player.image_label.text() == 'Error loading image'
+
+
+def test_results_from_replaced_workers_are_not_shown(player):
+    settle(player)
+    select(player, 0)
+    stale_lyrics = main_window.LyricsWorker('Stale', 'Artist')
+    stale_image = main_window.ImageWorker(player.http, 'https://i.scdn.co/stale')
+    stale_lyrics.signals.lyrics_ready.connect(player.update_lyrics)
+    stale_image.signals.image_ready.connect(player.update_image)
+
+    select(player, 1)
+    shown_pixmap = player.image_label.pixmap().cacheKey()
+    stale_lyrics.signals.lyrics_ready.emit('stale lyrics')
+    stale_image.signals.image_ready.emit('https://i.scdn.co/stale', png_bytes())
+
+    assert player.lyrics_view.toPlainText() == 'la la Two'
+    assert player.image_label.pixmap().cacheKey() == shown_pixmap
+    assert ('Stale', 'Artist') not in player.lyrics_cache
+
+
+def test_refresh_with_full_page_reloads_latest_tracks(player, monkeypatch):
+    settle(player)
+    monkeypatch.setattr(main_window, 'RECENT_TRACKS_LIMIT', 2)
+    monkeypatch.setattr(FakeSpotify, 'history', [
+        make_track('Five', 'Artist E', 5000),
+        make_track('Four', 'Artist D', 4000),
+        make_track('Three', 'Artist C', 3000),
+        *FakeSpotify.history,
+    ])
+    player.refresh_tracks()
+
+    shown = [player.track_list.item(row).text() for row in range(player.track_list.count())]
+    assert player.sp.calls == [None, 2000, None]
+    assert shown == ['Five - Artist E', 'Four - Artist D']
+    assert set(player.track_data) == {('Five', 'Artist E'), ('Four', 'Artist D')}
+    assert player._last_played_at == 5000
+
+
+def test_refresh_merges_new_plays_and_drops_the_oldest(player, monkeypatch):
+    settle(player)
+    assert player._last_played_at == 2000
+    monkeypatch.setattr(main_window, 'RECENT_TRACKS_LIMIT', 3)
+    monkeypatch.setattr(FakeSpotify, 'history', [
+        make_track('Four', 'Artist D', 4000),
+        make_track('Three', 'Artist C', 3000),
+        *FakeSpotify.history,
+    ])
+    player.refresh_tracks()
+
+    shown = [player.track_list.item(row).text() for row in range(player.track_list.count())]
+    assert player.sp.calls == [None, 2000]
+    assert shown == ['Four - Artist D', 'Three - Artist C', 'One - Artist A']
+    assert set(player.track_data) == {('Four', 'Artist D'), ('Three', 'Artist C'), ('One', 'Artist A')}
+    assert player._last_played_at == 4000
+
+    player.refresh_tracks()
+    assert player.sp.calls == [None, 2000, 4000]
+    assert player.track_list.count() == 3
+
+
+def test_lyrics_timeout_is_reported(player, monkeypatch):
+    class SlowGenius:
+        def search_song(self, track_name, artist_name):
+            raise main_window.requests.exceptions.Timeout()
+
+    settle(player)
+    monkeypatch.setattr(main_window, 'get_genius', SlowGenius)
+    select(player, 0)
+    assert player.lyrics_view.toPlainText() == 'Fetching lyrics timed out. Please try again later.'
+    assert ('One', 'Artist A') not in player.lyrics_cache
+
+
+def test_selection_is_not_queued_behind_prefetch(fakes, monkeypatch):
+    # Single-core machine: one thread per pool
+    monkeypatch.setattr(main_window, 'WORKER_THREADS', 1)
+    monkeypatch.setattr(main_window, 'PREFETCH_THREADS', 1)
+
+    # Every cover download except the first track's hangs until released
+    release = threading.Event()
+    def get(self, url, **kwargs):
+        if 'One' not in url:
+            release.wait(10)
+        return FakeResponse(fakes)
+    monkeypatch.setattr(main_window.requests.Session, 'get', get)
+
+    player = main_window.MiniPlayer()
+    try:
+        settle(player)
+        select(player, 0)
+        assert player.lyrics_view.toPlainText() == 'la la One'
+        assert not player.image_label.pixmap().isNull()
+    finally:
+        release.set()
+        close(player)
+
+
+def test_selecting_a_running_prefetch_does_not_download_twice(fakes, monkeypatch):
+    monkeypatch.setattr(main_window, 'PREFETCH_THREADS', 1)
+    release = threading.Event()
+    requested = []
+    def get(self, url, **kwargs):
+        requested.append(url)
+        if 'Two' in url:
+            release.wait(10)
+        return FakeResponse(fakes)
+    monkeypatch.setattr(main_window.requests.Session, 'get', get)
+
+    player = main_window.MiniPlayer()
+    try:
+        settle(player)
+        prefetch = player.prefetch_workers['https://i.scdn.co/Two-300']
+        assert prefetch.started
+
+        select(player, 1)
+        assert player.image_worker is prefetch
+        release.set()
+        settle(player)
+
+        assert requested.count('https://i.scdn.co/Two-300') == 1
+        assert player.image_label.pixmap().cacheKey() == player.pixmap_cache['https://i.scdn.co/Two-300'].cacheKey()
+        assert not player.prefetch_workers
+    finally:
+        release.set()
+        close(player)
+
+
+def test_selecting_a_queued_prefetch_downloads_it_for_display(fakes, monkeypatch):
+    monkeypatch.setattr(main_window, 'PREFETCH_THREADS', 1)
+    monkeypatch.setattr(FakeSpotify, 'history', [
+        make_track('One', 'Artist A', 3000),
+        make_track('Two', 'Artist B', 2000),
+        make_track('Three', 'Artist C', 1000),
+    ])
+    release = threading.Event()
+    def get(self, url, **kwargs):
+        if 'Two' in url:
+            release.wait(10)
+        return FakeResponse(fakes)
+    monkeypatch.setattr(main_window.requests.Session, 'get', get)
+
+    player = main_window.MiniPlayer()
+    try:
+        settle(player)
+        queued = player.prefetch_workers['https://i.scdn.co/Three-300']
+        assert not queued.started
+
+        select(player, 2)
+        assert player.image_worker is not queued
+        assert 'https://i.scdn.co/Three-300' in player.pixmap_cache
+        assert not player.image_label.pixmap().isNull()
+    finally:
+        release.set()
+        close(player)
+
+
+def test_shared_session_retries_rate_limits(player):
+    for url in ['https://i.scdn.co/One-300', 'https://api.spotify.com/v1/me/player/recently-played?limit=10']:
+        retries = player.http.get_adapter(url).max_retries
+        assert 429 in retries.status_forcelist
+        assert retries.total == 3
+        assert retries.backoff_factor > 0
+
+
+def spotify_response(request, status: int, body: dict = None, etag: str = None):
+    response = main_window.requests.Response()
+    response.status_code = status
+    response.request = request
+    response.url = request.url
+    response._content = json.dumps(body).encode() if body is not None else b''
+    if etag:
+        response.headers['ETag'] = etag
+    return response
+
+
+@pytest.fixture
+def spotify_server(monkeypatch):
+    """
+    Answer HTTPAdapter.send like Spotify: 200 with an ETag, then 304 when it is sent back
+    """
+    sent = []
+    def send(self, request, **kwargs):
+        sent.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return spotify_response(request, 304)
+        return spotify_response(request, 200, {'items': [], 'cursors': None}, etag='"v1"')
+    monkeypatch.setattr(main_window.HTTPAdapter, 'send', send)
+    return sent
+
+
+def test_conditional_get_adapter_revalidates_same_url(spotify_server):
+    session = main_window.requests.Session()
+    session.mount('https://api.spotify.com/', main_window.ConditionalGetAdapter())
+    url = 'https://api.spotify.com/v1/me/player/recently-played?limit=10'
+
+    assert session.get(url).status_code == 200
+    assert session.get(url).status_code == 304
+    assert session.get(url + '&after=1').status_code == 200
+
+    assert 'If-None-Match' not in spotify_server[0].headers
+    assert spotify_server[1].headers['If-None-Match'] == '"v1"'
+    assert 'If-None-Match' not in spotify_server[2].headers
+
+
+def test_refresh_keeps_list_when_spotify_answers_not_modified(player, spotify_server, capsys):
+    settle(player)
+    capsys.readouterr()
+    player.sp = Spotify(auth='token', requests_session=player.http)
+    shown = [player.track_list.item(row).text() for row in range(player.track_list.count())]
+
+    player.refresh_tracks()
+    player.refresh_tracks()
+
+    assert len(spotify_server) == 2
+    assert spotify_server[1].headers['If-None-Match'] == '"v1"'
+    assert [player.track_list.item(row).text() for row in range(player.track_list.count())] == shown
+    assert set(player.track_data) == {('One', 'Artist A'), ('Two', 'Artist B')}
+    assert 'Error' not in capsys.readouterr().out